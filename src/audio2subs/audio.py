@@ -6,28 +6,34 @@ import logging
 import os
 import subprocess
 import sys
-import tempfile
 import threading
-import time
-from typing import BinaryIO
+from typing import IO
 
 from audio2subs.exceptions import AudioExtractionError
-from audio2subs.transcription.base import SAMPLE_RATE, CHANNELS
+from audio2subs.transcription.base import SAMPLE_RATE, SAMPLE_WIDTH, CHANNELS
 from audio2subs.utils.performance import Timer
 
 logger = logging.getLogger(__name__)
 
 
 class AudioExtractor:
-    """Extracts audio from video files using FFmpeg in a background thread."""
+    """Extracts audio from video files using FFmpeg in a background thread.
+
+    FFmpeg writes raw PCM to stdout; a reader thread appends it to an in-memory
+    buffer so no temp file is written and re-read from disk.
+    """
+
+    READ_SIZE = 65536  # bytes per stdout read
 
     def __init__(self, video_path: str, duration: float, audio_track_id: int | None = None):
         self.video_path = video_path
         self.duration = duration
         self.audio_track_id = audio_track_id
 
-        self._temp_file_path: str | None = None
-        self._file_handle: BinaryIO | None = None
+        self._buffer = bytearray()
+        self._bytes_written = 0
+        self._lock = threading.Lock()
+        self._data_available = threading.Condition(self._lock)
         self._ffmpeg_process: subprocess.Popen | None = None
         self._closed = False
         self._extraction_complete = threading.Event()
@@ -38,10 +44,14 @@ class AudioExtractor:
         """Whether audio extraction is complete."""
         return self._extraction_complete.is_set()
 
+    @property
+    def bytes_available(self) -> int:
+        """Number of PCM bytes received from FFmpeg so far."""
+        with self._lock:
+            return self._bytes_written
+
     def extract_streaming(self) -> None:
         """Start audio extraction in a background thread."""
-        self._create_temp_file()
-        self._open_for_reading()
         thread = threading.Thread(
             target=self._extraction_worker,
             daemon=True,
@@ -53,21 +63,36 @@ class AudioExtractor:
         """Wait for extraction to complete. Returns True if done, False on timeout."""
         return self._extraction_complete.wait(timeout=timeout)
 
-    def read_all(self) -> bytes | None:
-        """Read the entire extracted audio as raw PCM bytes.
+    def read_chunk(self, start_time: float, end_time: float) -> bytes | None:
+        """Read raw PCM bytes for [start_time, end_time).
 
-        Must be called after extraction is complete.
+        Blocks until FFmpeg has produced the requested range or extraction ends.
+        Returns None if there is no audio at start_time.
         """
-        fh = self._file_handle  # snapshot to avoid race with close()
-        if fh is None:
-            return None
-        try:
-            with Timer("Read extracted audio from disk", logger):
-                fh.seek(0)
-                return fh.read()
-        except (IOError, ValueError) as e:
-            logger.error(f"Failed to read audio: {e}")
-            return None
+        frame_size = SAMPLE_WIDTH * CHANNELS
+        start_offset = int(start_time * SAMPLE_RATE) * frame_size
+        end_offset = int(end_time * SAMPLE_RATE) * frame_size
+
+        with self._data_available:
+            self._data_available.wait_for(
+                lambda: self._bytes_written >= end_offset
+                or self._extraction_complete.is_set()
+                or self._closed
+            )
+            if self._closed or start_offset >= self._bytes_written:
+                return None
+            return bytes(self._buffer[start_offset:end_offset])
+
+    def read_all(self) -> memoryview | None:
+        """Return the entire extracted audio as a read-only view of the raw PCM.
+
+        The view shares the extraction buffer, so no copy is made. Must be
+        called after extraction is complete.
+        """
+        with self._lock:
+            if self._closed or not self._extraction_complete.is_set():
+                return None
+            return memoryview(self._buffer).toreadonly()
 
     def close(self) -> None:
         """Kill FFmpeg if running and release all resources."""
@@ -77,21 +102,9 @@ class AudioExtractor:
             self._ffmpeg_process.kill()
             self._ffmpeg_process = None
 
-        if self._file_handle:
-            try:
-                self._file_handle.close()
-            except Exception:
-                pass
-            self._file_handle = None
-
-        if self._temp_file_path and os.path.exists(self._temp_file_path):
-            try:
-                os.remove(self._temp_file_path)
-                logger.debug(f"Cleaned up temp audio file: {self._temp_file_path}")
-            except OSError as e:
-                logger.warning(f"Failed to remove temp file: {e}")
-
-        self._temp_file_path = None
+        with self._data_available:
+            self._buffer = bytearray()
+            self._data_available.notify_all()
 
     # ------------------------------------------------------------------
     # Internal
@@ -105,23 +118,37 @@ class AudioExtractor:
             if not self._closed:
                 logger.error(f"Audio extraction failed for {os.path.basename(self.video_path)}: {e}")
         finally:
-            self._extraction_complete.set()
-
-    def _create_temp_file(self) -> None:
-        fd, self._temp_file_path = tempfile.mkstemp(suffix=".raw")
-        os.close(fd)
-        logger.debug(f"Created temp audio file: {self._temp_file_path}")
+            with self._data_available:
+                self._extraction_complete.set()
+                self._data_available.notify_all()
 
-    def _open_for_reading(self) -> None:
-        if not self._temp_file_path:
-            raise AudioExtractionError("No audio file to open")
-        self._file_handle = open(self._temp_file_path, "rb")
+    def _read_stdout(self, stream: IO[bytes]) -> None:
+        """Append FFmpeg's PCM output to the buffer until EOF."""
+        try:
+            while chunk := stream.read(self.READ_SIZE):
+                with self._data_available:
+                    if self._closed:
+                        return
+                    self._buffer += chunk
+                    self._bytes_written += len(chunk)
+                    self._data_available.notify_all()
+        except (OSError, ValueError):
+            pass  # pipe closed by close()/kill
+
+    @staticmethod
+    def _drain_stream(stream: IO[bytes] | None, sink: list[bytes]) -> None:
+        """Read a pipe to EOF, collecting its output."""
+        if stream is None:
+            return
+        try:
+            while chunk := stream.read(4096):
+                sink.append(chunk)
+        except (OSError, ValueError):
+            pass
 
     def _run_ffmpeg(self) -> None:
-        if not self._temp_file_path:
-            raise AudioExtractionError("Temp file not created")
-
-        cmd = ["ffmpeg", "-y", "-loglevel", "error", "-i", self.video_path]
+        # "-threads 0" lets the decoder use all cores for codecs that support it.
+        cmd = ["ffmpeg", "-y", "-loglevel", "error", "-threads", "0", "-i", self.video_path]
 
         if self.audio_track_id is not None:
             cmd.extend(["-map", f"0:a:{self.audio_track_id}"])
@@ -132,7 +159,8 @@ class AudioExtractor:
             "-ar", str(SAMPLE_RATE),
             "-ac", str(CHANNELS),
             "-f", "s16le",
-            self._temp_file_path,
+            "-flush_packets", "1",  # push PCM to the pipe as soon as it is muxed
+            "pipe:1",
         ])
 
         creationflags = subprocess.CREATE_NO_WINDOW if sys.platform == "win32" else 0
@@ -144,22 +172,44 @@ class AudioExtractor:
         with Timer(f"Audio extraction from {filename}", logger, duration=self.duration):
             process = subprocess.Popen(
                 cmd,
-                stdout=subprocess.DEVNULL,
+                stdout=subprocess.PIPE,
                 stderr=subprocess.PIPE,
                 creationflags=creationflags,
             )
             self._ffmpeg_process = process
 
+            reader = threading.Thread(
+                target=self._read_stdout,
+                args=(process.stdout,),
+                daemon=True,
+                name="AudioReader",
+            )
+            reader.start()
+
+            # Drain stderr concurrently so a chatty FFmpeg can't block on a full pipe.
+            stderr_chunks: list[bytes] = []
+            stderr_reader = threading.Thread(
+                target=self._drain_stream,
+                args=(process.stderr, stderr_chunks),
+                daemon=True,
+                name="FFmpegStderr",
+            )
+            stderr_reader.start()
+
             try:
-                start_time = time.time()
-                while process.poll() is None:
-                    if time.time() - start_time > timeout:
-                        process.kill()
-                        raise AudioExtractionError(f"FFmpeg timed out after {timeout}s for {filename}")
-                    time.sleep(0.1)
+                try:
+                    process.wait(timeout=timeout)
+                except subprocess.TimeoutExpired:
+                    process.kill()
+                    raise AudioExtractionError(
+                        f"FFmpeg timed out after {timeout}s for {filename}"
+                    ) from None
+
+                reader.join()
+                stderr_reader.join()
 
                 if process.returncode != 0:
-                    stderr = process.stderr.read().decode(errors="ignore") if process.stderr else ""
+                    stderr = b"".join(stderr_chunks).decode(errors="ignore")
                     raise AudioExtractionError(
                         f"FFmpeg exited with code {process.returncode}",
                         stderr=stderr,
@@ -167,10 +217,14 @@ class AudioExtractor:
             finally:
                 if process.poll() is None:
                     process.kill()
+                reader.join(timeout=5.0)
+                stderr_reader.join(timeout=5.0)
+                if process.stdout:
+                    process.stdout.close()
                 if process.stderr:
                     process.stderr.close()
 
-        logger.info("Audio extraction complete")
+        logger.info(f"Audio extraction complete ({self.bytes_available // 1024}KB)")
 
     def __enter__(self) -> "AudioExtractor":
         return self
@@ -4,11 +4,17 @@ from __future__ import annotations
 
 import os
 from dataclasses import dataclass, field
+from functools import cache
 from typing import Literal
 
 
+@cache
 def _resolve_device(device: Literal["cuda", "cpu", "auto"]) -> str:
-    """Resolve 'auto' to the actual available device."""
+    """Resolve 'auto' to the actual available device.
+
+    Cached: probing CUDA imports torch and initializes the CUDA runtime, and
+    the answer can't change within a process.
+    """
     if device == "auto":
         try:
             import torch
@@ -25,6 +31,8 @@ class TranscriptionConfig:
     model_name: str = "CohereLabs/cohere-transcribe-03-2026"
     device: Literal["cuda", "cpu", "auto"] = "auto"
     language: str = "en"  # ISO-639-1 language code (e.g. 'en', 'fr', 'de')
+    compile_model: bool = False  # torch.compile the ASR model (slower startup)
+    quantize_cpu: bool = False  # int8 dynamic quantization when running on CPU
 
     def get_device(self) -> str:
         """Resolve 'auto' to the actual device."""
@@ -72,6 +80,10 @@ class ServiceConfig:
             config.socket_path = socket
         if os.environ.get("AUDIO2SUBS_CPU_ONLY", "").lower() in ("1", "true"):
             config.transcription.device = "cpu"
+        if os.environ.get("AUDIO2SUBS_COMPILE", "").lower() in ("1", "true"):
+            config.transcription.compile_model = True
+        if os.environ.get("AUDIO2SUBS_QUANTIZE", "").lower() in ("1", "true"):
+            config.transcription.quantize_cpu = True
 
         return config
 
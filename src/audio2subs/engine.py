@@ -147,5 +147,8 @@ class TranscriptionEngine:
         except Exception as e:
             logger.error(f"{self._log_prefix} Worker error: {e}", exc_info=True)
         finally:
+            # The engine is one-shot: drop the PCM buffer (~115MB per hour of
+            # audio) now rather than holding it until stop() at the next file.
+            self._audio.close()
             self._finished_event.set()
             logger.info(f"{self._log_prefix} Worker stopped")
@@ -32,6 +32,7 @@ class MPVClient:
     """
     
     CLIENT_NAME = "ai_subtitle_service"
+    TRACK_ADD_TIMEOUT = 0.5  # seconds to wait for a new track to appear in track-list
     
     def __init__(self, socket_path: str):
         """Connect to MPV via IPC socket.
@@ -233,14 +234,21 @@ class MPVClient:
             logger.info(f"Adding new AI subtitle with flag '{flag}'")
             self._mpv.sub_add(path, flag)
             
-            # Use retry loop since track list propagation can be asynchronous
-            for _ in range(5):
-                time.sleep(0.1)
+            # Track list propagation can be asynchronous: check right away, then
+            # retry with short, doubling sleeps instead of a fixed 100ms stall.
+            deadline = time.monotonic() + self.TRACK_ADD_TIMEOUT
+            delay = 0.005
+            while True:
                 new_track = self._find_ai_track(path)
                 if new_track:
                     self._ai_track_id = new_track.get('id')
                     logger.info(f"AI track added with ID: {self._ai_track_id}")
                     break
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                time.sleep(min(delay, remaining))
+                delay = min(delay * 2, 0.1)
             
             return True
             
@@ -277,18 +285,34 @@ class MPVClient:
         """Find the AI subtitle track in the track list."""
         try:
             target_path = os.path.normpath(path)
+
+            # Stat the target at most once per scan (a failure included). Its inode
+            # is not cached across calls because SubtitleWriter replaces the file.
+            target_stat: os.stat_result | None = None
+            target_statted = False
             for track in self.track_list:
                 if track.get('type') != 'sub':
                     continue
                 external = track.get('external-filename')
                 if external:
                     ext_path = os.path.normpath(external)
-                    try:
-                        if os.path.samefile(target_path, ext_path):
-                            return track
-                    except (OSError, ValueError):
-                        if target_path.lower() == ext_path.lower():
-                            return track
+                    if ext_path == target_path:
+                        return track
+                    if not target_statted:
+                        target_statted = True
+                        try:
+                            target_stat = os.stat(target_path)
+                        except (OSError, ValueError):
+                            pass
+                    if target_stat is not None:
+                        try:
+                            if os.path.samestat(os.stat(ext_path), target_stat):
+                                return track
+                            continue
+                        except (OSError, ValueError):
+                            pass
+                    if target_path.lower() == ext_path.lower():
+                        return track
         except (MPVError, BrokenPipeError) as e:
             logger.warning(f"Failed to query track list: {e}")
         return None
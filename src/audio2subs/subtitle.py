@@ -32,9 +32,9 @@ class SubtitleWriter:
 
     def initialize(self) -> None:
         """Write an empty ASS file so MPV can load the subtitle track."""
-        header = self._build_header()
+        header = self._build_header().encode("utf-8")
         try:
-            with open(self.output_path, "w", encoding="utf-8") as f:
+            with open(self.output_path, "wb") as f:
                 f.write(header)
             logger.info(f"Initialized subtitle file: {os.path.basename(self.output_path)}")
         except IOError as e:
@@ -51,11 +51,15 @@ class SubtitleWriter:
         if self.video_width and self.video_height:
             ass_content = self._inject_playres(ass_content)
 
+        # Encode once and write in binary mode: skips the text layer's
+        # incremental encoder and newline translation.
+        data = ass_content.encode("utf-8")
+
         temp_path = self.output_path + ".tmp"
         try:
             with Timer("Atomic Subtitle Write to disk", logger):
-                with open(temp_path, "w", encoding="utf-8") as f:
-                    f.write(ass_content)
+                with open(temp_path, "wb") as f:
+                    f.write(data)
                 os.replace(temp_path, self.output_path)
 
             if self.on_update:
@@ -1,5 +1,15 @@
 """Transcription backend interfaces and implementations."""
 
+import os
+import sys
+
+# Must be set before torch is first imported (the backends import it lazily).
+# Expandable segments let the CUDA caching allocator grow blocks in place
+# instead of fragmenting VRAM across differently sized inputs (unsupported
+# on Windows).
+if sys.platform != "win32":
+    os.environ.setdefault("PYTORCH_CUDA_ALLOC_CONF", "expandable_segments:True")
+
 from audio2subs.transcription.base import (
     TranscriptionResult,
     BaseTranscriber,
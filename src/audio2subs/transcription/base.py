@@ -2,9 +2,11 @@
 
 from __future__ import annotations
 
+import hashlib
 import logging
 import threading
 from abc import ABC, abstractmethod
+from collections import OrderedDict
 from dataclasses import dataclass
 
 logger = logging.getLogger(__name__)
@@ -12,6 +14,7 @@ logger = logging.getLogger(__name__)
 # Audio format constants (expected by all transcribers)
 SAMPLE_RATE = 16000
 CHANNELS = 1
+SAMPLE_WIDTH = 2  # bytes per sample (s16le)
 
 
 @dataclass
@@ -29,9 +32,14 @@ class TranscriptionResult:
 class BaseTranscriber(ABC):
     """Abstract base class for transcription backends."""
 
+    # Finished results kept for re-requests of the same audio (LRU).
+    RESULT_CACHE_SIZE = 8
+
     def __init__(self):
         self._is_loaded = False
         self._loaded_event = threading.Event()
+        self._result_cache: OrderedDict[tuple[int, bytes], TranscriptionResult] = OrderedDict()
+        self._result_cache_lock = threading.Lock()
 
     @property
     def is_loaded(self) -> bool:
@@ -42,18 +50,39 @@ class BaseTranscriber(ABC):
         return self._loaded_event.wait(timeout)
 
     @abstractmethod
-    def transcribe(self, audio_buffer: bytes) -> TranscriptionResult:
+    def transcribe(self, audio_buffer: bytes | memoryview) -> TranscriptionResult:
         """Transcribe raw PCM audio.
 
         Args:
-            audio_buffer: Raw PCM audio bytes (16kHz, mono, 16-bit)
+            audio_buffer: Raw PCM audio (16kHz, mono, 16-bit)
 
         Returns:
             TranscriptionResult with full_text and ass_content
         """
         pass
 
+    @staticmethod
+    def _cache_key(audio_buffer: bytes | memoryview) -> tuple[int, bytes]:
+        """Key a PCM buffer by its length and a digest of its full contents."""
+        return len(audio_buffer), hashlib.blake2b(audio_buffer, digest_size=16).digest()
+
+    def _get_cached_result(self, key: tuple[int, bytes]) -> TranscriptionResult | None:
+        with self._result_cache_lock:
+            result = self._result_cache.get(key)
+            if result is not None:
+                self._result_cache.move_to_end(key)
+            return result
+
+    def _cache_result(self, key: tuple[int, bytes], result: TranscriptionResult) -> None:
+        with self._result_cache_lock:
+            self._result_cache[key] = result
+            self._result_cache.move_to_end(key)
+            while len(self._result_cache) > self.RESULT_CACHE_SIZE:
+                self._result_cache.popitem(last=False)
+
     def close(self) -> None:
         """Release resources held by the transcriber."""
         logger.info(f"Closing transcriber: {self.__class__.__name__}")
         self._is_loaded = False
+        with self._result_cache_lock:
+            self._result_cache.clear()
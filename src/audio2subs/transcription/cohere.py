@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
+import gc
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 
 import numpy as np
@@ -18,16 +20,93 @@ from audio2subs.utils.performance import Timer
 
 logger = logging.getLogger(__name__)
 
+_PCM_SCALE = np.float32(1.0 / 32768.0)
+
+
+def _aligner_model_name(language: str) -> str:
+    """Pick the stable-ts Whisper model used to align text in `language`."""
+    return "base.en" if language == "en" else "base"
+
+
+def _split_long_spans(
+    audio: np.ndarray, spans: list[dict[str, int]], max_samples: int, frame: int = 480
+) -> list[tuple[int, int]]:
+    """Turn VAD spans into (start, end) pairs no longer than `max_samples`.
+
+    An over-long span is cut at the quietest `frame`-sample frame (30ms by
+    default) in the back half of each allowed piece, so cuts land in pauses
+    between words rather than at fixed offsets.
+    """
+    pieces: list[tuple[int, int]] = []
+    for ts in spans:
+        start, end = ts["start"], ts["end"]
+        while end - start > max_samples:
+            lo = start + max_samples // 2
+            n_frames = (start + max_samples - lo) // frame
+            if n_frames:
+                frames = audio[lo:lo + n_frames * frame].reshape(n_frames, frame)
+                energy = np.einsum("ij,ij->i", frames, frames)
+                cut = lo + int(np.argmin(energy)) * frame + frame // 2
+            else:
+                cut = start + max_samples
+            pieces.append((start, cut))
+            start = cut
+        pieces.append((start, end))
+    return pieces
+
+
+def _group_speech_spans(
+    spans: list[tuple[int, int]], max_samples: int
+) -> list[list[tuple[int, int]]]:
+    """Pack consecutive speech spans into groups spanning at most `max_samples`.
+
+    Groups break on the silence between spans. Each span must itself fit in
+    `max_samples` (see _split_long_spans).
+    """
+    groups: list[list[tuple[int, int]]] = []
+    current: list[tuple[int, int]] = []
+    for start, end in spans:
+        if current and end - current[0][0] > max_samples:
+            groups.append(current)
+            current = []
+        current.append((start, end))
+    if current:
+        groups.append(current)
+    return groups
+
+
+def _half_except_layernorm(model: Any) -> None:
+    """Cast a Whisper model's weights to fp16 in place, keeping LayerNorm in fp32.
+
+    Whisper's Linear/Conv1d cast their weights to the input dtype on every
+    forward, so fp32 weights with fp16 activations pay a conversion per call.
+    Its LayerNorm runs in fp32 and needs fp32 parameters.
+    """
+    import torch
+
+    for module in model.modules():
+        if isinstance(module, torch.nn.LayerNorm):
+            continue
+        for param in module.parameters(recurse=False):
+            param.data = param.data.half()
+
 
 class CohereTranscriber(BaseTranscriber):
     """Cohere ASR with stable-ts post-processing pipeline.
 
-    1. Silero VAD zeros out non-speech regions to prevent hallucinations.
-    2. CohereAsrForConditionalGeneration produces plain text from audio.
+    1. Silero VAD finds speech; it is packed into short windows with the
+       silence in between zeroed out to prevent hallucinations.
+    2. CohereAsrForConditionalGeneration transcribes the windows in batches.
     3. stable-ts align → refine → remove_repetition → adjust_gaps → regroup
        produces timed subtitle segments and generates ASS output.
     """
 
+    # Cached-but-unused VRAM above which the allocator cache is released after a run.
+    CUDA_CACHE_SLACK_BYTES = 512 * 1024 * 1024
+    # Longest VAD window sent to the ASR model, and windows per generate() call.
+    MAX_WINDOW_SECONDS = 20
+    ASR_BATCH_SIZE = 8
+
     def __init__(
         self,
         config: TranscriptionConfig,
@@ -38,8 +117,10 @@ class CohereTranscriber(BaseTranscriber):
         self.subtitle_config = subtitle_config or SubtitleConfig()
         self._processor: Any = None
         self._model: Any = None         # CohereAsrForConditionalGeneration
-        self._aligner: Any = None       # stable-ts Whisper model (base.en)
+        self._aligner: Any = None       # stable-ts Whisper model
+        self._device = "cpu"
         self._vad: Any = None           # Silero VAD model
+        self._batch_size = self.ASR_BATCH_SIZE  # shrinks on CUDA OOM
 
     # ------------------------------------------------------------------
     # Model loading
@@ -55,7 +136,7 @@ class CohereTranscriber(BaseTranscriber):
             try:
                 import torch
                 from transformers import AutoProcessor, CohereAsrForConditionalGeneration
-                import stable_whisper
+                import stable_whisper  # noqa: F401 - fail fast if missing
             except ImportError as e:
                 missing = str(e).split("'")[-2] if "'" in str(e) else "required dependencies"
                 msg = (
@@ -79,22 +160,26 @@ class CohereTranscriber(BaseTranscriber):
                     logger.warning("CUDA requested but unavailable — falling back to CPU.")
                     device = "cpu"
 
-            # --- Cohere ASR ---
-            with Timer(f"Loading Cohere ASR ({self.config.model_name})", logger):
-                self._processor = AutoProcessor.from_pretrained(self.config.model_name)
-                self._model = CohereAsrForConditionalGeneration.from_pretrained(
-                    self.config.model_name,
-                    torch_dtype=dtype,
-                ).to(device)
+            # The aligner and VAD don't depend on the Cohere checkpoint, so load
+            # them on a side thread while the (much larger) ASR model loads.
+            with ThreadPoolExecutor(max_workers=1, thread_name_prefix="AuxModelLoader") as pool:
+                aux_future = pool.submit(self._load_aux_models, device)
+
+                # --- Cohere ASR ---
+                with Timer(f"Loading Cohere ASR ({self.config.model_name})", logger):
+                    self._processor = AutoProcessor.from_pretrained(self.config.model_name)
+                    self._model = CohereAsrForConditionalGeneration.from_pretrained(
+                        self.config.model_name,
+                        torch_dtype=dtype,
+                    ).to(device)
 
-            # --- stable-ts aligner (tiny Whisper, CPU) ---
-            with Timer("Loading stable-ts aligner (base.en)", logger):
-                self._aligner = stable_whisper.load_model("base.en", device=device)
+                self._aligner, self._vad = aux_future.result()
+                self._device = device
 
-            # --- Silero VAD (CPU, ~2MB) ---
-            with Timer("Loading Silero VAD", logger):
-                from silero_vad import load_silero_vad
-                self._vad = load_silero_vad()
+            if self.config.quantize_cpu and device == "cpu":
+                self._quantize_model()
+            if self.config.compile_model:
+                self._compile_model()
 
             self._is_loaded = True
             self._loaded_event.set()
@@ -111,17 +196,88 @@ class CohereTranscriber(BaseTranscriber):
                 raise TranscriptionError(f"Failed to load Cohere model: {e}") from e
             raise
 
+    def _quantize_model(self) -> None:
+        """Apply dynamic int8 quantization to the Cohere model's Linear layers (CPU only).
+
+        Weights are stored as int8 and activations quantized on the fly, which
+        cuts weight memory traffic ~4x versus fp32 and uses VNNI/AVX-512 int8
+        matmuls where available, at a small accuracy cost.
+        """
+        import torch
+
+        try:
+            with Timer("Dynamic int8 quantization", logger):
+                torch.ao.quantization.quantize_dynamic(
+                    self._model, {torch.nn.Linear}, dtype=torch.qint8, inplace=True
+                )
+            logger.info("Cohere ASR quantized to int8 (CPU)")
+        except Exception as e:
+            logger.warning(f"int8 quantization failed, using fp32: {e}")
+
+    def _compile_model(self) -> None:
+        """Compile the Cohere encoder with torch.compile and prewarm it.
+
+        Only the encoder is compiled, since it runs once per batch and carries
+        most of the FLOPs. Its input still varies in batch size and padded
+        length, so it is compiled with dynamic shapes in the default mode (kernel
+        fusion only): one graph serves every batch, and no per-shape CUDA graphs
+        or memory pools pile up over a long video. Compilation happens lazily on
+        the first call, so run one second of silence through generate() here
+        rather than stalling the first real request. Falls back to eager mode if
+        compilation fails.
+        """
+        import torch
+
+        encoder = self._model.get_encoder()
+        try:
+            encoder.forward = torch.compile(encoder.forward, dynamic=True)
+            with Timer("torch.compile warmup", logger):
+                self._generate_text([np.zeros(SAMPLE_RATE, dtype=np.float32)])
+            logger.info("torch.compile enabled for the Cohere encoder")
+        except Exception as e:
+            logger.warning(f"torch.compile failed, using eager mode: {e}")
+            # Drop the instance override so nn.Module dispatches to the original forward
+            encoder.__dict__.pop("forward", None)
+
+    def _load_aux_models(self, device: str) -> tuple[Any, Any]:
+        """Load the stable-ts aligner for the configured language and Silero VAD."""
+        aligner = self._load_aligner(_aligner_model_name(self.config.language), device)
+
+        # --- Silero VAD (CPU, ~2MB) ---
+        with Timer("Loading Silero VAD", logger):
+            from silero_vad import load_silero_vad
+            vad = load_silero_vad()
+
+        return aligner, vad
+
+    def _load_aligner(self, model_name: str, device: str) -> Any:
+        """Load a stable-ts Whisper model for forced alignment."""
+        import stable_whisper
+
+        with Timer(f"Loading stable-ts aligner ({model_name})", logger):
+            aligner = stable_whisper.load_model(model_name, device=device)
+            if device == "cuda":
+                _half_except_layernorm(aligner)
+        return aligner
+
     # ------------------------------------------------------------------
     # Transcription
     # ------------------------------------------------------------------
 
-    def transcribe(self, audio_buffer: bytes) -> TranscriptionResult:
+    def transcribe(self, audio_buffer: bytes | memoryview) -> TranscriptionResult:
         if not self._is_loaded or self._model is None:
             raise TranscriptionError("Cohere model is not loaded")
 
         if not audio_buffer:
             return TranscriptionResult()
 
+        with Timer("Audio hash (result cache lookup)", logger):
+            cache_key = self._cache_key(audio_buffer)
+            cached = self._get_cached_result(cache_key)
+        if cached is not None:
+            logger.info("Reusing cached transcription for identical audio")
+            return cached
+
         try:
             audio_duration = len(audio_buffer) / (SAMPLE_RATE * 2)  # 16-bit PCM Mono
             
@@ -132,28 +288,59 @@ class CohereTranscriber(BaseTranscriber):
                 text = self._run_cohere(audio_float)
                 if not text:
                     logger.debug("Cohere returned no text")
-                    return TranscriptionResult()
+                    result = TranscriptionResult()
+                    self._cache_result(cache_key, result)
+                    return result
 
                 # stable-ts pipeline → ASS subtitle content
                 ass_content = self._run_stable_ts(audio_float, text)
 
-                return TranscriptionResult(full_text=text.strip(), ass_content=ass_content)
+                result = TranscriptionResult(full_text=text.strip(), ass_content=ass_content)
+                if ass_content:
+                    # Don't pin a failed alignment; a retry may succeed.
+                    self._cache_result(cache_key, result)
+                return result
 
         except Exception as e:
             logger.error(f"Cohere transcription failed: {e}", exc_info=True)
             raise TranscriptionError(f"Transcription failed: {e}") from e
+        finally:
+            self._trim_cuda_cache()
 
     # ------------------------------------------------------------------
     # Internal helpers
     # ------------------------------------------------------------------
 
-    def _pcm_to_float(self, audio_buffer: bytes) -> np.ndarray:
+    def _pcm_to_float(self, audio_buffer: bytes | memoryview) -> np.ndarray:
+        """Convert s16le PCM to float32 in [-1, 1)."""
         with Timer("PCM -> Float conversion", logger):
-            arr = np.frombuffer(audio_buffer, dtype=np.int16)
-            return arr.astype(np.float32) / 32768.0
+            samples = np.frombuffer(audio_buffer, dtype=np.int16)
+            # Single fused cast + scale pass, no intermediate float array.
+            return np.multiply(samples, _PCM_SCALE, dtype=np.float32)
+
+    def _trim_cuda_cache(self) -> None:
+        """Release cached VRAM back to the driver if the allocator is holding a lot of it.
+
+        empty_cache() forces later allocations to go back to cudaMalloc, so only
+        pay for it when reserved memory well exceeds what is actually in use.
+        """
+        if self._device != "cuda":
+            return
 
-    def _apply_vad(self, audio_float: np.ndarray) -> np.ndarray:
-        """Zero out non-speech regions using Silero VAD."""
+        import torch
+
+        slack = torch.cuda.memory_reserved() - torch.cuda.memory_allocated()
+        if slack > self.CUDA_CACHE_SLACK_BYTES:
+            logger.debug(f"Releasing {slack // (1024 * 1024)}MB of cached VRAM")
+            torch.cuda.empty_cache()
+
+    def _speech_windows(self, audio_float: np.ndarray) -> list[np.ndarray]:
+        """Cut the waveform into VAD-aligned speech windows for batched ASR.
+
+        Silence between speech spans inside a window is zeroed (to prevent
+        hallucinations); silence between windows is dropped entirely.
+        Returns an empty list if the audio contains no speech at all.
+        """
         from silero_vad import get_speech_timestamps
 
         with Timer("Silero VAD", logger, duration=len(audio_float) / SAMPLE_RATE):
@@ -169,61 +356,103 @@ class CohereTranscriber(BaseTranscriber):
 
         if not speech_timestamps:
             logger.debug("VAD: no speech detected")
-            return np.zeros_like(audio_float)
-
-        with Timer("VAD Masking", logger):
-            speech_s = sum(ts["end"] - ts["start"] for ts in speech_timestamps) / SAMPLE_RATE
-            logger.debug(
-                f"VAD: {len(speech_timestamps)} segments, "
-                f"{speech_s:.1f}s / {len(audio_float) / SAMPLE_RATE:.1f}s speech"
-            )
+            return []
+
+        with Timer("VAD Windowing", logger):
+            if logger.isEnabledFor(logging.DEBUG):
+                speech_s = sum(ts["end"] - ts["start"] for ts in speech_timestamps) / SAMPLE_RATE
+                logger.debug(
+                    f"VAD: {len(speech_timestamps)} segments, "
+                    f"{speech_s:.1f}s / {len(audio_float) / SAMPLE_RATE:.1f}s speech"
+                )
 
-            mask = np.zeros(len(audio_float), dtype=np.float32)
-            for ts in speech_timestamps:
-                mask[ts["start"]:ts["end"]] = 1.0
-            return audio_float * mask
+            windows = []
+            max_samples = self.MAX_WINDOW_SECONDS * SAMPLE_RATE
+            spans = _split_long_spans(audio_float, speech_timestamps, max_samples)
+            for group in _group_speech_spans(spans, max_samples):
+                offset = group[0][0]
+                window = np.zeros(group[-1][1] - offset, dtype=np.float32)
+                for start, end in group:
+                    window[start - offset:end - offset] = audio_float[start:end]
+                windows.append(window)
+            return windows
 
     def _run_cohere(self, audio_float: np.ndarray) -> str:
         """Run Cohere ASR on a float32 waveform and return plain text."""
+        if self._vad is None:
+            return self._generate_text([audio_float])
+
+        windows = self._speech_windows(audio_float)
+        if not windows:
+            return ""  # all silence - skip the ASR forward pass entirely
+        return self._generate_text(windows)
+
+    def _generate_text(self, windows: list[np.ndarray]) -> str:
+        """Transcribe waveforms in batches and join the text.
+
+        Batches start at ASR_BATCH_SIZE; a CUDA OOM halves the batch size
+        (remembered for later calls) and retries the same windows.
+        """
         import torch
 
-        language = self.config.language
+        duration = sum(len(w) for w in windows) / SAMPLE_RATE
+        texts: list[str] = []
+        with Timer(f"Cohere ASR (Full, {len(windows)} windows)", logger, duration=duration):
+            i = 0
+            while i < len(windows):
+                batch = windows[i:i + self._batch_size]
+                try:
+                    texts.extend(self._generate_batch(batch))
+                    i += len(batch)
+                    continue
+                except torch.cuda.OutOfMemoryError:
+                    if len(batch) == 1:
+                        raise
+                # Outside the except block, so the failed attempt's tensors
+                # (still referenced by the traceback there) can be released.
+                torch.cuda.empty_cache()
+                self._batch_size = len(batch) // 2
+                logger.warning(
+                    f"CUDA out of memory, retrying with ASR batch size {self._batch_size}"
+                )
+        return " ".join(t for t in texts if t)
 
-        if self._vad is not None:
-            audio_float = self._apply_vad(audio_float)
+    def _generate_batch(self, batch: list[np.ndarray]) -> list[str]:
+        """Run the Cohere processor + generate() + decode on one batch of waveforms."""
+        import torch
 
-        duration = len(audio_float) / SAMPLE_RATE
-        with Timer("Cohere ASR (Full)", logger, duration=duration):
-            with Timer("ASR Preprocessing (Processor)", logger):
-                inputs = self._processor(
-                    audio=audio_float,
-                    sampling_rate=SAMPLE_RATE,
-                    return_tensors="pt",
+        language = self.config.language
+        with Timer("ASR Preprocessing (Processor)", logger):
+            inputs = self._processor(
+                audio=batch,
+                sampling_rate=SAMPLE_RATE,
+                return_tensors="pt",
+                language=language,
+            )
+            audio_chunk_index = inputs.get("audio_chunk_index")
+
+        with Timer("ASR Data Move (Host -> Device)", logger):
+            inputs = inputs.to(self._model.device, dtype=self._model.dtype)
+
+        with Timer(f"ASR Generation (Inference, batch={len(batch)})", logger):
+            with torch.inference_mode():
+                longest = max(len(w) for w in batch) / SAMPLE_RATE
+                max_tokens = max(256, int(longest * 14))
+                output_ids = self._model.generate(**inputs, max_new_tokens=max_tokens)
+
+        with Timer("ASR Decoding (IDs -> Text)", logger):
+            if audio_chunk_index is not None:
+                result = self._processor.decode(
+                    output_ids,
+                    skip_special_tokens=True,
+                    audio_chunk_index=audio_chunk_index,
                     language=language,
                 )
-                audio_chunk_index = inputs.get("audio_chunk_index")
-
-            with Timer("ASR Data Move (Host -> Device)", logger):
-                inputs = inputs.to(self._model.device, dtype=self._model.dtype)
-
-            with Timer("ASR Generation (Inference)", logger):
-                with torch.inference_mode():
-                    max_tokens = max(256, int(duration * 14))
-                    output_ids = self._model.generate(**inputs, max_new_tokens=max_tokens)
-
-            with Timer("ASR Decoding (IDs -> Text)", logger):
-                if audio_chunk_index is not None:
-                    result = self._processor.decode(
-                        output_ids,
-                        skip_special_tokens=True,
-                        audio_chunk_index=audio_chunk_index,
-                        language=language,
-                    )
-                    text = result[0] if isinstance(result, list) else result
-                else:
-                    text = self._processor.decode(output_ids, skip_special_tokens=True)
+                texts = result if isinstance(result, list) else [result]
+            else:
+                texts = self._processor.batch_decode(output_ids, skip_special_tokens=True)
 
-        return text.strip()
+        return [t.strip() for t in texts]
 
     def _run_stable_ts(self, audio_float: np.ndarray, text: str) -> str:
         """Run the full stable-ts pipeline and return ASS subtitle content.
@@ -231,13 +460,17 @@ class CohereTranscriber(BaseTranscriber):
         Pipeline: align → refine → remove_repetition → adjust_gaps → regroup → to_ass.
         Uses the original (non-VAD) audio for accurate alignment.
         """
+        import torch
+
         language = self.config.language
+        aligner = self._aligner
 
         duration = len(audio_float) / SAMPLE_RATE
+
         # --- Forced alignment ---
         try:
-            with Timer("stable-ts align()", logger, duration=duration):
-                result = self._aligner.align(
+            with Timer("stable-ts align()", logger, duration=duration), torch.inference_mode():
+                result = aligner.align(
                     audio_float,
                     text,
                     language=language,
@@ -259,8 +492,8 @@ class CohereTranscriber(BaseTranscriber):
         result.segments = [s for s in result.segments if (s.end - s.start) > 0.03]
 
         try:
-            with Timer("stable-ts refine()", logger, duration=duration):
-                self._aligner.refine(audio_float, result, only_voice_freq=True, verbose=None)
+            with Timer("stable-ts refine()", logger, duration=duration), torch.inference_mode():
+                aligner.refine(audio_float, result, only_voice_freq=True, verbose=None)
         except Exception as e:
             logger.warning(f"stable-ts refine() failed, using unrefined: {e}")
 
@@ -304,12 +537,6 @@ class CohereTranscriber(BaseTranscriber):
     def close(self) -> None:
         super().close()
 
-        try:
-            import torch
-            _has_torch = True
-        except ImportError:
-            _has_torch = False
-
         if self._model is not None:
             logger.info("Releasing Cohere ASR model from memory")
             del self._model
@@ -328,10 +555,23 @@ class CohereTranscriber(BaseTranscriber):
             del self._vad
             self._vad = None
 
-        if _has_torch:
+        # Collect first so reference cycles inside the models don't keep their
+        # tensors alive, then let queued kernels finish before releasing the
+        # allocator cache.
+        gc.collect()
+
+        if self._device != "cuda":
+            return
+
+        try:
             import torch
-            if torch.cuda.is_available():
-                torch.cuda.empty_cache()
+            torch.cuda.synchronize()
+            torch.cuda.empty_cache()
+            torch.cuda.ipc_collect()
+        except ImportError:
+            pass
+        except RuntimeError as e:
+            logger.warning(f"Failed to release CUDA memory: {e}")
 
     def __enter__(self) -> "CohereTranscriber":
         self.load()
@@ -36,8 +36,10 @@ class Timer(ContextDecorator):
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb):
+        if not self.logger.isEnabledFor(self.level):
+            return False
         elapsed = time.perf_counter() - self.start_perf
-        
+
         msg = f"[{self.name}] took {elapsed:.2f}s"
         
         if self.duration and self.duration > 0:
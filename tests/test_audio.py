@@ -31,3 +31,12 @@ def test_read_chunk_empty():
     ext = AudioExtractor("dummy.mp4", duration=10.0)
     ext._extraction_complete.set()
     assert ext.read_chunk(0.0, 1.0) is None
+
+def test_read_chunk_slices_buffer():
+    ext = AudioExtractor("dummy.mp4", duration=10.0)
+    ext._buffer = bytearray(range(256)) * 250  # 64000 bytes = 2s
+    ext._bytes_written = len(ext._buffer)
+    ext._extraction_complete.set()
+    chunk = ext.read_chunk(1.0, 2.0)
+    assert chunk == bytes(ext._buffer[32000:64000])
+    assert ext.read_chunk(2.0, 3.0) is None
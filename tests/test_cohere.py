@@ -0,0 +1,104 @@
+import sys
+import types
+
+import numpy as np
+import pytest
+
+from audio2subs.config import TranscriptionConfig
+from audio2subs.transcription.base import TranscriptionResult
+from audio2subs.transcription.cohere import (
+    CohereTranscriber,
+    _group_speech_spans,
+    _split_long_spans,
+)
+
+
+def test_group_speech_spans_packs_until_limit():
+    groups = _group_speech_spans([(0, 40), (50, 90), (120, 160)], max_samples=100)
+    assert groups == [[(0, 40), (50, 90)], [(120, 160)]]
+    assert _group_speech_spans([], max_samples=100) == []
+
+def test_split_long_spans_cuts_at_quietest_frame():
+    audio = np.ones(400, dtype=np.float32)
+    audio[80:90] = 0.0
+    audio[155:165] = 0.0
+    spans = _split_long_spans(audio, [{"start": 10, "end": 260}], max_samples=100, frame=10)
+    assert spans == [(10, 85), (85, 160), (160, 260)]
+    assert _split_long_spans(audio, [{"start": 0, "end": 50}], max_samples=100) == [(0, 50)]
+
+def test_speech_windows_zero_gaps_and_drop_silence(monkeypatch):
+    spans = [
+        {"start": 0, "end": 4000},
+        {"start": 6000, "end": 10000},
+        {"start": 20000, "end": 24000},
+    ]
+    fake_vad = types.ModuleType("silero_vad")
+    fake_vad.get_speech_timestamps = lambda audio, model, **kwargs: spans
+    monkeypatch.setitem(sys.modules, "silero_vad", fake_vad)
+
+    t = CohereTranscriber(TranscriptionConfig())
+    t._vad = object()
+    t.MAX_WINDOW_SECONDS = 1  # 16000 samples
+    audio = np.full(40000, 0.5, dtype=np.float32)
+
+    windows = t._speech_windows(audio)
+    assert [len(w) for w in windows] == [10000, 4000]
+    assert np.all(windows[0][:4000] == 0.5)
+    assert np.all(windows[0][4000:6000] == 0.0)
+    assert np.all(windows[1] == 0.5)
+
+    spans = []
+    assert t._speech_windows(audio) == []
+
+def _fake_torch():
+    torch = types.ModuleType("torch")
+    torch.cuda = types.SimpleNamespace(
+        OutOfMemoryError=type("OutOfMemoryError", (RuntimeError,), {}),
+        empty_cache=lambda: None,
+    )
+    return torch
+
+def test_generate_text_halves_batch_on_oom(monkeypatch):
+    torch = _fake_torch()
+    monkeypatch.setitem(sys.modules, "torch", torch)
+    t = CohereTranscriber(TranscriptionConfig())
+    batches = []
+
+    def generate_batch(batch):
+        batches.append(len(batch))
+        if len(batch) > 2:
+            raise torch.cuda.OutOfMemoryError("CUDA out of memory")
+        return [str(int(w[0])) for w in batch]
+
+    t._generate_batch = generate_batch
+    windows = [np.full(10, i, dtype=np.float32) for i in range(11)]
+
+    assert t._generate_text(windows) == " ".join(str(i) for i in range(11))
+    assert batches == [8, 4, 2, 2, 2, 2, 2, 1]
+    assert t._batch_size == 2
+    assert t._generate_text(windows[:3]) == "0 1 2"  # starts at the reduced size
+
+def test_generate_text_oom_at_batch_size_one_propagates(monkeypatch):
+    torch = _fake_torch()
+    monkeypatch.setitem(sys.modules, "torch", torch)
+    t = CohereTranscriber(TranscriptionConfig())
+
+    def generate_batch(batch):
+        raise torch.cuda.OutOfMemoryError("CUDA out of memory")
+
+    t._generate_batch = generate_batch
+    with pytest.raises(torch.cuda.OutOfMemoryError):
+        t._generate_text([np.zeros(10, dtype=np.float32)] * 3)
+    assert t._batch_size == 1
+
+def test_result_cache_is_bounded_lru():
+    t = CohereTranscriber(TranscriptionConfig())
+    t.RESULT_CACHE_SIZE = 2
+    keys = [t._cache_key(bytes([i]) * 64) for i in range(3)]
+    assert t._cache_key(memoryview(bytes([0]) * 64)) == keys[0]
+    t._cache_result(keys[0], TranscriptionResult(full_text="a"))
+    t._cache_result(keys[1], TranscriptionResult(full_text="b"))
+    assert t._get_cached_result(keys[0]).full_text == "a"  # now most recent
+    t._cache_result(keys[2], TranscriptionResult(full_text="c"))
+    assert t._get_cached_result(keys[1]) is None
+    assert t._get_cached_result(keys[0]).full_text == "a"
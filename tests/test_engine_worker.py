@@ -0,0 +1,27 @@
+from unittest.mock import MagicMock
+
+from audio2subs.config import ServiceConfig
+from audio2subs.engine import TranscriptionEngine
+from audio2subs.transcription.base import TranscriptionResult
+
+
+def test_worker_releases_audio_buffer_after_transcription(tmp_path):
+    transcriber = MagicMock()
+    transcriber.is_loaded = True
+    transcriber.transcribe.return_value = TranscriptionResult()
+    eng = TranscriptionEngine(
+        video_path=str(tmp_path / "video.mp4"),
+        duration=2.0,
+        transcriber=transcriber,
+        config=ServiceConfig(),
+    )
+    eng._audio._buffer = bytearray(64000)
+    eng._audio._bytes_written = 64000
+    eng._audio._extraction_complete.set()
+
+    eng._worker()
+
+    assert len(transcriber.transcribe.call_args.args[0]) == 64000
+    assert eng.is_finished
+    assert eng._audio.read_all() is None
+    assert len(eng._audio._buffer) == 0